@@ -0,0 +1,26 @@
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+preload_app = True
+default_workers = 2 * multiprocessing.cpu_count() + 1
+workers = int(os.getenv("GUNICORN_WORKERS", default_workers))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+
+def on_starting(server):
+    # Build the Redis client once in the master so every worker inherits it
+    # instead of constructing its own on the first request.
+    from page_tracker.app import redis
+
+    redis()
+
+
+def post_fork(server, worker):
+    # Drop any sockets inherited from the master; each worker opens its own.
+    from page_tracker.app import app
+
+    pool = app.extensions.get("redis_pool")
+    if pool is not None:
+        pool.reset()
@@ -1,25 +1,133 @@
 import os
+import threading
+import time
 from functools import cache
 
-from flask import Flask
-from redis import Redis, RedisError
+from flask import Flask, Response, request
+from redis import BlockingConnectionPool, Redis, RedisError
+
+MAX_BATCH_SIZE = 1000
+COALESCE_WINDOW = float(os.getenv("PAGE_VIEWS_COALESCE_MS", "0")) / 1000
+ERROR_LOG_RATE = 10  # Redis error tracebacks logged per second
 
 app = Flask(__name__)
 
+_PREFIX = "🎉 This page has been viewed ".encode("utf-8")
+_SUFFIX = " times! Thanks for visiting!".encode("utf-8")
+_ERROR_BODY = "Sorry, something went wrong \N{PENSIVE FACE}".encode("utf-8")
+
 
 @app.get("/")
 def index():
     try:
-        page_views = redis().incr("page_views")
+        if _coalescer is None:
+            body = _page_views_body(redis().incr("page_views"))
+        else:
+            body = _coalescer.record()
+    except RedisError:
+        return _redis_error()
+    else:
+        return Response(body)
+
+
+@app.get("/batch")
+def batch():
+    count = request.args.get("n", type=int)
+    if count is None or not 1 <= count <= MAX_BATCH_SIZE:
+        return f"Batch size must be between 1 and {MAX_BATCH_SIZE}", 400
+    try:
+        page_views = redis().incr("page_views", count)
     except RedisError:
-        app.logger.exception("Redis Error")
-        return "Sorry, something went wrong \N{PENSIVE FACE}", 500
+        return _redis_error()
     else:
-        message = f"🎉 This page has been viewed {page_views} times! "
-        message += "Thanks for visiting!"
-        return message
+        return Response(_page_views_body(page_views))
+
+
+def _page_views_body(page_views):
+    return _PREFIX + str(page_views).encode("utf-8") + _SUFFIX
+
+
+def _redis_error():
+    if _error_log_bucket.try_consume():
+        suppressed = _error_log_bucket.take_refused()
+        app.logger.exception("Redis Error (suppressed=%d)", suppressed)
+    return Response(_ERROR_BODY, status=500)
 
 
 @cache
 def redis():
-    return Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
+    pool = BlockingConnectionPool.from_url(
+        os.getenv("REDIS_URL", "redis://localhost:6379"),
+        max_connections=int(os.getenv("REDIS_MAX_CONN", "32")),
+        timeout=2,
+    )
+    app.extensions["redis_pool"] = pool
+    return Redis(connection_pool=pool)
+
+
+class _ViewCoalescer:  # pylint: disable=too-few-public-methods
+    """Serve every view within one time window from a single INCRBY.
+
+    The first request of a window increments the counter by the views
+    coalesced since the previous flush and renders the new total; the rest
+    of the window gets that body back without touching Redis. Reported
+    counts may lag by up to one window, and views still pending when the
+    worker exits are lost.
+    """
+
+    def __init__(self, window):
+        self._window = window
+        self._lock = threading.Lock()
+        self._tick = None
+        self._body = None
+        self._pending = 0
+
+    def record(self):
+        tick = int(time.monotonic() / self._window)
+        with self._lock:
+            if tick == self._tick:
+                self._pending += 1
+                return self._body
+            amount, self._pending = self._pending + 1, 0
+        try:
+            body = _page_views_body(redis().incr("page_views", amount))
+        except RedisError:
+            with self._lock:
+                self._pending += amount - 1
+            raise
+        with self._lock:
+            self._tick, self._body = tick, body
+        return body
+
+
+class _TokenBucket:
+    """Allow up to ``capacity`` events per ``period`` seconds."""
+
+    def __init__(self, capacity, period):
+        self._capacity = capacity
+        self._rate = capacity / period
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._refused = 0
+        self._lock = threading.Lock()
+
+    def try_consume(self):
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._updated) * self._rate
+            self._tokens = min(self._capacity, self._tokens + refill)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self._refused += 1
+            return False
+
+    def take_refused(self):
+        with self._lock:
+            refused, self._refused = self._refused, 0
+            return refused
+
+
+_error_log_bucket = _TokenBucket(ERROR_LOG_RATE, 1.0)
+_coalescer = _ViewCoalescer(COALESCE_WINDOW) if COALESCE_WINDOW > 0 else None
@@ -1,5 +1,9 @@
+import os
+
 import pytest
 import redis
+import requests
+from requests.adapters import HTTPAdapter
 
 from page_tracker.app import app
 
@@ -9,6 +13,13 @@ def pytest_addoption(parser):
     parser.addoption("--redis-url")
 
 
+def pytest_configure(config):
+    # Point the app under test at the same Redis as the redis_client fixture.
+    redis_url = config.getoption("--redis-url")
+    if redis_url:
+        os.environ.setdefault("REDIS_URL", redis_url)
+
+
 @pytest.fixture(scope="session")
 def flask_url(request):
     return request.config.getoption("--flask-url")
@@ -20,6 +31,15 @@ def redis_url(request):
 
 
 @pytest.fixture
+def session():
+    with requests.Session() as http_session:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+        http_session.mount("http://", adapter)
+        http_session.mount("https://", adapter)
+        yield http_session
+
+
+@pytest.fixture(scope="module")
 def http_client():
     return app.test_client("/")
 
@@ -4,12 +4,12 @@ import requests
 
 
 @pytest.mark.timeout(1.5)
-def test_should_update_redis(redis_client, flask_url):
+def test_should_update_redis(redis_client, flask_url, session):
     # Given
     redis_client.set("page_views", 4)
 
     # When
-    response = requests.get(flask_url)
+    response = session.get(flask_url)
 
     # Then
     assert response.status_code == 200
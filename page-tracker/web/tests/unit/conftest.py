@@ -0,0 +1,24 @@
+import unittest.mock
+
+import pytest
+
+from page_tracker.app import app
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _app_ctx():
+    # Requests reuse an already pushed app context instead of pushing their own.
+    with app.app_context():
+        yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    return app.test_client()
+
+
+@pytest.fixture(scope="module")
+def _mock_redis():
+    with unittest.mock.patch("page_tracker.app.redis") as mock_redis:
+        mock_redis.return_value.incr.return_value = 1
+        yield mock_redis
@@ -3,7 +3,7 @@ import unittest.mock
 import pytest
 from redis import BusyLoadingError, ConnectionError, ResponseError, TimeoutError
 
-from page_tracker.app import app
+from page_tracker.app import _TokenBucket, _ViewCoalescer
 
 
 @unittest.mock.patch("page_tracker.app.redis")
@@ -31,6 +31,7 @@ def test_should_handle_redis_connection_error(mock_redis, http_client):
     # Then
     assert response.status_code == 500
     assert response.text == "Sorry, something went wrong \N{PENSIVE FACE}"
+    assert response.content_type == "text/html; charset=utf-8"
 
 
 # Edge Case Tests for Redis Errors
@@ -206,3 +207,149 @@ def test_should_handle_redis_incr_returning_string(mock_redis, http_client):
     assert (
         response.text == "🎉 This page has been viewed 123 times! Thanks for visiting!"
     )
+
+
+@unittest.mock.patch("page_tracker.app.redis")
+def test_should_return_utf8_encoded_body(mock_redis, http_client):
+    # Given
+    mock_redis.return_value.incr.return_value = 7
+
+    # When
+    response = http_client.get("/")
+
+    # Then
+    assert response.status_code == 200
+    assert response.content_type == "text/html; charset=utf-8"
+    assert response.data == (
+        "🎉 This page has been viewed 7 times! Thanks for visiting!".encode("utf-8")
+    )
+
+
+# Batch Endpoint Tests
+@unittest.mock.patch("page_tracker.app.redis")
+def test_should_increment_by_batch_size(mock_redis, http_client):
+    # Given
+    mock_redis.return_value.incr.return_value = 15
+
+    # When
+    response = http_client.get("/batch?n=10")
+
+    # Then
+    assert response.status_code == 200
+    assert (
+        response.text == "🎉 This page has been viewed 15 times! Thanks for visiting!"
+    )
+    mock_redis.return_value.incr.assert_called_once_with("page_views", 10)
+
+
+@unittest.mock.patch("page_tracker.app.redis")
+def test_should_reject_invalid_batch_size(mock_redis, http_client):
+    # Given
+    invalid_sizes = ["", "?n=0", "?n=-1", "?n=1001", "?n=abc"]
+
+    # When
+    responses = [http_client.get(f"/batch{size}") for size in invalid_sizes]
+
+    # Then
+    assert all(r.status_code == 400 for r in responses)
+    mock_redis.return_value.incr.assert_not_called()
+
+
+@unittest.mock.patch("page_tracker.app.redis")
+def test_should_handle_redis_error_in_batch(mock_redis, http_client):
+    # Given
+    mock_redis.return_value.incr.side_effect = ConnectionError
+
+    # When
+    response = http_client.get("/batch?n=5")
+
+    # Then
+    assert response.status_code == 500
+    assert response.text == "Sorry, something went wrong \N{PENSIVE FACE}"
+
+
+# View Coalescing Tests
+@unittest.mock.patch("page_tracker.app.time.monotonic")
+@unittest.mock.patch("page_tracker.app.redis")
+def test_should_coalesce_views_within_window(mock_redis, mock_monotonic):
+    # Given - Three views in one window, then one in the next
+    mock_monotonic.side_effect = [10.1, 10.5, 10.9, 11.2]
+    mock_redis.return_value.incr.side_effect = [1, 4]
+    coalescer = _ViewCoalescer(1.0)
+
+    # When
+    bodies = [coalescer.record() for _ in range(4)]
+
+    # Then
+    assert bodies[0] == bodies[1] == bodies[2]
+    assert b"viewed 1 times!" in bodies[0]
+    assert b"viewed 4 times!" in bodies[3]
+    assert mock_redis.return_value.incr.call_args_list == [
+        unittest.mock.call("page_views", 1),
+        unittest.mock.call("page_views", 3),
+    ]
+
+
+@unittest.mock.patch("page_tracker.app.time.monotonic")
+@unittest.mock.patch("page_tracker.app.redis")
+def test_should_keep_pending_views_after_redis_error(mock_redis, mock_monotonic):
+    # Given - The flush of a coalesced view fails once
+    mock_monotonic.side_effect = [10.1, 10.5, 11.2, 12.3]
+    mock_redis.return_value.incr.side_effect = [1, ConnectionError, 3]
+    coalescer = _ViewCoalescer(1.0)
+
+    # When
+    coalescer.record()
+    coalescer.record()
+    with pytest.raises(ConnectionError):
+        coalescer.record()
+    body = coalescer.record()
+
+    # Then - The coalesced view is flushed with the next request
+    assert b"viewed 3 times!" in body
+    assert mock_redis.return_value.incr.call_args_list[-1] == unittest.mock.call(
+        "page_views", 2
+    )
+
+
+@unittest.mock.patch("page_tracker.app._coalescer")
+def test_should_serve_coalesced_body_when_enabled(mock_coalescer, http_client):
+    # Given
+    mock_coalescer.record.return_value = b"cached body"
+
+    # When
+    response = http_client.get("/")
+
+    # Then
+    assert response.status_code == 200
+    assert response.data == b"cached body"
+
+
+# Error Log Rate Limiting Tests
+@unittest.mock.patch("page_tracker.app.time.monotonic")
+def test_token_bucket_refuses_when_empty_and_refills(mock_monotonic):
+    # Given - A bucket of two tokens per second
+    mock_monotonic.side_effect = [0.0, 0.1, 0.2, 0.3, 0.8]
+    bucket = _TokenBucket(2, 1.0)
+
+    # When
+    results = [bucket.try_consume() for _ in range(4)]
+
+    # Then - Half a second later one token has been refilled
+    assert results == [True, True, False, True]
+    assert bucket.take_refused() == 1
+    assert bucket.take_refused() == 0
+
+
+@unittest.mock.patch("page_tracker.app._error_log_bucket", _TokenBucket(1, 60.0))
+@unittest.mock.patch("page_tracker.app.redis")
+def test_should_rate_limit_redis_error_logs(mock_redis, http_client, caplog):
+    # Given
+    mock_redis.return_value.incr.side_effect = ConnectionError
+
+    # When
+    responses = [http_client.get("/") for _ in range(3)]
+
+    # Then - Every request fails but only the first traceback is logged
+    assert all(r.status_code == 500 for r in responses)
+    assert [r.getMessage() for r in caplog.records] == ["Redis Error (suppressed=0)"]
@@ -1,10 +1,20 @@
-import unittest.mock
-
 import pytest
 from flask import Flask
 
 from page_tracker.app import app
 
+pytestmark = pytest.mark.usefixtures("_mock_redis")
+
+_RULES = list(app.url_map.iter_rules())
+_RULE_PATHS = frozenset(rule.rule for rule in _RULES)
+
+
+def _request_status(client, url, method="GET", **kwargs):
+    """Issue a request and return its status without reading the body"""
+    response = client.open(url, method=method, buffered=False, **kwargs)
+    response.close()
+    return response.status_code
+
 
 def test_flask_app_creation():
     """Test Flask app is created correctly"""
@@ -26,443 +36,125 @@ def test_flask_app_routes():
     """Test Flask app routes are registered correctly"""
     # Given/When
     # Then
-    rules = [rule.rule for rule in app.url_map.iter_rules()]
-    assert "/" in rules
+    assert "/" in _RULE_PATHS
+    assert "/batch" in _RULE_PATHS
 
 
 def test_flask_app_route_methods():
     """Test Flask app route methods"""
     # Given/When
     # Then
-    rules = list(app.url_map.iter_rules())
-    root_rule = next(rule for rule in rules if rule.rule == "/")
+    root_rule = next(rule for rule in _RULES if rule.rule == "/")
     assert "GET" in root_rule.methods
 
 
-def test_flask_app_with_test_client():
+def test_flask_app_with_test_client(client):
     """Test Flask app works with test client"""
-    # Given
-    client = app.test_client()
-
     # When
-    response = client.get("/")
+    status_code = _request_status(client, "/")
 
     # Then
-    assert response.status_code in [200, 500]  # 200 if Redis works, 500 if not
+    assert status_code == 200
 
 
-def test_flask_app_with_different_http_methods():
+@pytest.mark.parametrize(
+    "method,expected_status",
+    [
+        ("GET", 200),
+        ("POST", 405),
+        ("PUT", 405),
+        ("DELETE", 405),
+        ("PATCH", 405),
+        ("HEAD", 200),
+        ("OPTIONS", 200),
+    ],
+)
+def test_flask_app_with_http_methods(client, method, expected_status):
     """Test Flask app with different HTTP methods"""
-    # Given
-    client = app.test_client()
-
-    # When - Test GET method
-    get_response = client.get("/")
-
-    # When - Test POST method (should return 405 Method Not Allowed)
-    post_response = client.post("/")
-
-    # Then
-    assert get_response.status_code in [200, 500]
-    assert post_response.status_code == 405  # Method Not Allowed
-
-
-def test_flask_app_with_put_method():
-    """Test Flask app with PUT method"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.put("/")
-
-    # Then
-    assert response.status_code == 405  # Method Not Allowed
-
-
-def test_flask_app_with_delete_method():
-    """Test Flask app with DELETE method"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.delete("/")
-
-    # Then
-    assert response.status_code == 405  # Method Not Allowed
-
-
-def test_flask_app_with_patch_method():
-    """Test Flask app with PATCH method"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.patch("/")
-
-    # Then
-    assert response.status_code == 405  # Method Not Allowed
-
-
-def test_flask_app_with_head_method():
-    """Test Flask app with HEAD method"""
-    # Given
-    client = app.test_client()
-
     # When
-    response = client.head("/")
+    status_code = _request_status(client, "/", method=method)
 
     # Then
-    assert response.status_code in [200, 500]
-
+    assert status_code == expected_status
 
-def test_flask_app_with_options_method():
-    """Test Flask app with OPTIONS method"""
-    # Given
-    client = app.test_client()
 
-    # When
-    response = client.options("/")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_invalid_route():
+def test_flask_app_with_invalid_route(client):
     """Test Flask app with invalid route"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/invalid-route")
-
-    # Then
-    assert response.status_code == 404
-
-
-def test_flask_app_with_query_parameters():
-    """Test Flask app with query parameters"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/?param1=value1&param2=value2")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_fragment():
-    """Test Flask app with URL fragment"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/#fragment")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_unicode_in_url():
-    """Test Flask app with unicode characters in URL"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/?unicode=测试")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_special_characters_in_url():
-    """Test Flask app with special characters in URL"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/?special=!@#$%^&*()")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_very_long_url():
-    """Test Flask app with very long URL"""
-    # Given
-    client = app.test_client()
-    long_param = "a" * 1000
-
-    # When
-    response = client.get(f"/?long={long_param}")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_multiple_query_parameters():
-    """Test Flask app with multiple query parameters"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/?param1=value1&param2=value2&param3=value3&param4=value4")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_empty_query_parameters():
-    """Test Flask app with empty query parameters"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/?param1=&param2=&param3=")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_none_query_parameters():
-    """Test Flask app with None query parameters"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/?param1&param2&param3")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_duplicate_query_parameters():
-    """Test Flask app with duplicate query parameters"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/?param=value1&param=value2&param=value3")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_encoded_query_parameters():
-    """Test Flask app with URL encoded query parameters"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/?param=value%20with%20spaces")
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_json_content_type():
-    """Test Flask app with JSON content type header"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/", headers={"Content-Type": "application/json"})
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_custom_headers():
-    """Test Flask app with custom headers"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get(
-        "/", headers={"User-Agent": "TestAgent/1.0", "X-Custom-Header": "CustomValue"}
-    )
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_accept_header():
-    """Test Flask app with Accept header"""
-    # Given
-    client = app.test_client()
-
     # When
-    response = client.get("/", headers={"Accept": "text/html,application/xhtml+xml"})
+    status_code = _request_status(client, "/invalid-route")
 
     # Then
-    assert response.status_code in [200, 500]
-
+    assert status_code == 404
 
-def test_flask_app_with_authorization_header():
-    """Test Flask app with Authorization header"""
-    # Given
-    client = app.test_client()
 
-    # When
-    response = client.get("/", headers={"Authorization": "Bearer token123"})
-
-    # Then
-    assert response.status_code in [200, 500]
+URL_CASES = [
+    ("query_parameters", "/?param1=value1&param2=value2"),
+    ("fragment", "/#fragment"),
+    ("unicode_in_url", "/?unicode=测试"),
+    ("special_characters_in_url", "/?special=!@#$%^&*()"),
+    ("very_long_url", "/?long=" + "a" * 1000),
+    (
+        "multiple_query_parameters",
+        "/?param1=value1&param2=value2&param3=value3&param4=value4",
+    ),
+    ("empty_query_parameters", "/?param1=&param2=&param3="),
+    ("none_query_parameters", "/?param1&param2&param3"),
+    ("duplicate_query_parameters", "/?param=value1&param=value2&param=value3"),
+    ("encoded_query_parameters", "/?param=value%20with%20spaces"),
+]
 
+HEADER_CASES = [
+    ("json_content_type", {"Content-Type": "application/json"}),
+    (
+        "custom_headers",
+        {"User-Agent": "TestAgent/1.0", "X-Custom-Header": "CustomValue"},
+    ),
+    ("accept_header", {"Accept": "text/html,application/xhtml+xml"}),
+    ("authorization_header", {"Authorization": "Bearer token123"}),
+    ("cookie", {"Cookie": "session=abc123; user=test"}),
+    ("referer_header", {"Referer": "https://example.com"}),
+    ("user_agent_header", {"User-Agent": "Mozilla/5.0 (Test Browser)"}),
+    ("x_forwarded_for_header", {"X-Forwarded-For": "192.168.1.1"}),
+    ("x_real_ip_header", {"X-Real-IP": "10.0.0.1"}),
+    ("https_header", {"X-Forwarded-Proto": "https"}),
+    ("host_header", {"Host": "example.com"}),
+    ("connection_header", {"Connection": "keep-alive"}),
+    ("cache_control_header", {"Cache-Control": "no-cache"}),
+    ("pragma_header", {"Pragma": "no-cache"}),
+    (
+        "if_modified_since_header",
+        {"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    ),
+    ("if_none_match_header", {"If-None-Match": '"abc123"'}),
+]
 
-def test_flask_app_with_cookie():
-    """Test Flask app with cookies"""
-    # Given
-    client = app.test_client()
 
+@pytest.mark.parametrize("name,url", URL_CASES, ids=[name for name, _ in URL_CASES])
+def test_flask_app_with_url_variants(client, name, url):
+    """Test Flask app with query strings, fragments and unusual URLs"""
     # When
-    response = client.get("/", headers={"Cookie": "session=abc123; user=test"})
+    status_code = _request_status(client, url)
 
     # Then
-    assert response.status_code in [200, 500]
+    assert status_code == 200
 
 
-def test_flask_app_with_referer_header():
-    """Test Flask app with Referer header"""
-    # Given
-    client = app.test_client()
-
+@pytest.mark.parametrize(
+    "name,headers", HEADER_CASES, ids=[name for name, _ in HEADER_CASES]
+)
+def test_flask_app_with_header_variants(client, name, headers):
+    """Test Flask app with common request headers"""
     # When
-    response = client.get("/", headers={"Referer": "https://example.com"})
+    status_code = _request_status(client, "/", headers=headers)
 
     # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_user_agent_header():
-    """Test Flask app with User-Agent header"""
-    # Given
-    client = app.test_client()
+    assert status_code == 200
 
-    # When
-    response = client.get("/", headers={"User-Agent": "Mozilla/5.0 (Test Browser)"})
-
-    # Then
-    assert response.status_code in [200, 500]
 
-
-def test_flask_app_with_x_forwarded_for_header():
-    """Test Flask app with X-Forwarded-For header"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/", headers={"X-Forwarded-For": "192.168.1.1"})
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_x_real_ip_header():
-    """Test Flask app with X-Real-IP header"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/", headers={"X-Real-IP": "10.0.0.1"})
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_https_header():
-    """Test Flask app with HTTPS header"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/", headers={"X-Forwarded-Proto": "https"})
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_host_header():
-    """Test Flask app with Host header"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/", headers={"Host": "example.com"})
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_connection_header():
-    """Test Flask app with Connection header"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/", headers={"Connection": "keep-alive"})
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_cache_control_header():
-    """Test Flask app with Cache-Control header"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/", headers={"Cache-Control": "no-cache"})
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_pragma_header():
-    """Test Flask app with Pragma header"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/", headers={"Pragma": "no-cache"})
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_if_modified_since_header():
-    """Test Flask app with If-Modified-Since header"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get(
-        "/", headers={"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
-    )
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_if_none_match_header():
-    """Test Flask app with If-None-Match header"""
-    # Given
-    client = app.test_client()
-
-    # When
-    response = client.get("/", headers={"If-None-Match": '"abc123"'})
-
-    # Then
-    assert response.status_code in [200, 500]
-
-
-def test_flask_app_with_range_header():
+def test_flask_app_with_range_header(client):
     """Test Flask app with Range header"""
-    # Given
-    client = app.test_client()
-
     # When
-    response = client.get("/", headers={"Range": "bytes=0-1023"})
+    status_code = _request_status(client, "/", headers={"Range": "bytes=0-1023"})
 
     # Then
-    assert response.status_code in [200, 500, 206]  # 206 for partial content
+    assert status_code in [200, 206]  # 206 for partial content